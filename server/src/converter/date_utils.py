@@ -8,6 +8,16 @@ from datetime import date, datetime
 from typing import Dict, Any, Optional
 import re
 
+YEAR_RE = re.compile(r"\b(1[0-9]{3}|2[0-9]{3})\b")
+DATE_FORMATS = (
+    "%m/%d/%Y",
+    "%d/%m/%Y",
+    "%Y-%m-%d",
+    "%Y",
+    "%m/%Y",
+    "%Y-%m",
+)
+
 
 def parse_date_dict_to_date(date_dict: Dict[str, Any]) -> Optional[date]:
     """
@@ -43,16 +53,13 @@ def parse_date_string_to_date(date_str: str) -> Optional[date]:
     if not date_str:
         return None
 
-    date_formats = [
-        "%m/%d/%Y",
-        "%d/%m/%Y",
-        "%Y-%m-%d",
-        "%Y",
-        "%m/%Y",
-        "%Y-%m",
-    ]
+    if len(date_str) == 10 and date_str[4] == date_str[7] == "-":
+        try:
+            return date.fromisoformat(date_str)
+        except ValueError:
+            pass
 
-    for fmt in date_formats:
+    for fmt in DATE_FORMATS:
         try:
             parsed_datetime = datetime.strptime(date_str, fmt)
             return parsed_datetime.date()
@@ -60,7 +67,7 @@ def parse_date_string_to_date(date_str: str) -> Optional[date]:
             continue
 
     try:
-        year_match = re.search(r"\b(1[0-9]{3}|2[0-9]{3})\b", date_str)
+        year_match = YEAR_RE.search(date_str)
         if year_match:
             year = int(year_match.group(1))
             return date(year, 1, 1)
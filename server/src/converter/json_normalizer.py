@@ -4,24 +4,47 @@ JSON normalization utilities for GeneWeb converter.
 Handles conversion between database JSON and GeneWeb format.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import date, datetime
 from uuid import UUID
 
 
 def convert_to_json_serializable(obj):
     """Recursively convert objects into JSON-serializable types."""
-    if isinstance(obj, dict):
-        return {k: convert_to_json_serializable(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_to_json_serializable(v) for v in obj]
-    elif isinstance(obj, (date, datetime)):
-        return obj.isoformat()
-    elif isinstance(obj, UUID):
-        return str(obj)
-    else:
+    obj_type = type(obj)
+    if obj_type in _JSON_PASSTHROUGH_TYPES:
         return obj
 
+    converter = _JSON_CONVERTERS.get(obj_type) or _find_json_converter(obj)
+    return converter(obj) if converter else obj
+
+
+def _convert_dict(obj: dict) -> dict:
+    return {k: convert_to_json_serializable(v) for k, v in obj.items()}
+
+
+def _convert_list(obj: list) -> list:
+    return [convert_to_json_serializable(v) for v in obj]
+
+
+_JSON_PASSTHROUGH_TYPES = frozenset({str, int, float, bool, type(None)})
+# datetime subclasses date, so it must come first for the isinstance fallback.
+_JSON_CONVERTERS = {
+    dict: _convert_dict,
+    list: _convert_list,
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    UUID: str,
+}
+
+
+def _find_json_converter(obj):
+    """Find the converter for subclasses of the types in ``_JSON_CONVERTERS``."""
+    for base, converter in _JSON_CONVERTERS.items():
+        if isinstance(obj, base):
+            return converter
+    return None
+
 
 def normalize_db_json(db_json: dict) -> dict:
     """
@@ -29,7 +52,9 @@ def normalize_db_json(db_json: dict) -> dict:
     """
     person_lookup = _build_person_lookup(db_json)
     persons = _build_persons_list(db_json)
-    children_by_family = _build_children_by_family(db_json, person_lookup)
+    children_by_family = _build_children_by_family(
+        db_json, person_lookup, _build_person_index(db_json)
+    )
     families = _build_families_list(db_json, person_lookup, children_by_family)
     notes = _build_notes_list(db_json, person_lookup)
     extended_pages = _build_extended_pages_list(db_json)
@@ -47,67 +72,30 @@ def normalize_db_json(db_json: dict) -> dict:
 
 def _build_person_lookup(db_json: dict) -> Dict[str, str]:
     """Build person lookup dictionary."""
-    person_lookup = {}
-    for p in db_json.get("persons", []):
-        person_id = str(p.get("id"))
-        name = f"{p.get('first_name', '')} {p.get('last_name', '')}".strip()
-        person_lookup[person_id] = name
-    return person_lookup
-
-
-def _build_events_by_person(db_json: dict) -> Dict[str, list]:
-    """Build events grouped by person ID."""
-    events_by_person = {}
-    for event in db_json.get("events", []):
-        person_id = event.get("person_id")
-        if person_id:
-            person_id = str(person_id)
-            if person_id not in events_by_person:
-                events_by_person[person_id] = []
-
-            # Convert event to GeneWeb format
-            event_data = {
-                "type": event.get("type", ""),
-                "date": event.get("date", ""),
-                "place": event.get("place", ""),
-                "description": event.get("description", ""),
-            }
+    return {str(p.get("id")): _full_name(p) for p in db_json.get("persons", [])}
+
 
-            # Create raw event string for GeneWeb format
-            raw_parts = []
-            if event_data["type"]:
-                raw_parts.append(f"#{event_data['type'].lower()}")
-            if event_data["date"]:
-                # Convert date to string if it's a date object
-                date_str = (
-                    str(event_data["date"])
-                    if hasattr(event_data["date"], "strftime")
-                    else event_data["date"]
-                )
-                raw_parts.append(date_str)
-            if event_data["place"]:
-                raw_parts.append(f"#p {event_data['place']}")
-            if event_data["description"]:
-                raw_parts.append(f"note {event_data['description']}")
-
-            event_data["raw"] = " ".join(raw_parts)
-            events_by_person[person_id].append(event_data)
-
-    return events_by_person
+def _full_name(p: dict) -> str:
+    """Join the non-empty first and last names of a person."""
+    return " ".join(filter(None, (p.get("first_name"), p.get("last_name")))).strip()
+
+
+def _build_person_index(db_json: dict) -> Dict[str, dict]:
+    """Build a dictionary of persons keyed by their string ID."""
+    person_index = {}
+    for p in db_json.get("persons", []):
+        person_index.setdefault(str(p.get("id")), p)
+    return person_index
 
 
 def _build_persons_list(db_json: dict) -> list:
     """Build persons list from database JSON."""
-    persons = []
-    for p in db_json.get("persons", []):
-        person_data = _build_single_person(p)
-        persons.append(person_data)
-    return persons
+    return [_build_single_person(p) for p in db_json.get("persons", [])]
 
 
 def _build_single_person(p: dict) -> dict:
     """Build a single person data structure."""
-    raw = f"{p.get('first_name', '')} {p.get('last_name', '')}".strip()
+    raw = _full_name(p)
     tags = _build_person_tags(p)
     dates = _build_person_dates(p)
     person_events = _build_person_events(p)
@@ -245,60 +233,38 @@ def _convert_date_to_string(date) -> str:
 
 
 def _build_children_by_family(
-    db_json: dict, person_lookup: Dict[str, str]
+    db_json: dict,
+    person_lookup: Dict[str, str],
+    person_index: Optional[Dict[str, dict]] = None,
 ) -> Dict[str, list]:
     """Build children by family dictionary."""
+    if person_index is None:
+        person_index = _build_person_index(db_json)
     children_by_family = {}
     for c in db_json.get("children", []):
-        family_id = str(c.get("family_id"))
+        family_children = children_by_family.setdefault(str(c.get("family_id")), [])
         child_id = str(c.get("child_id"))
-
-        _ensure_family_exists(children_by_family, family_id)
-        context = {
-            "db_json": db_json,
-            "children_by_family": children_by_family,
-            "family_id": family_id,
-            "child_id": child_id,
-            "person_lookup": person_lookup,
-        }
-        _add_child_if_valid(context)
+        child_person = _find_person_by_id(person_index, child_id)
+        if child_person and child_id in person_lookup:
+            family_children.append(
+                _create_child_data(child_person, person_lookup[child_id])
+            )
 
     return children_by_family
 
 
-def _ensure_family_exists(children_by_family: Dict[str, list], family_id: str) -> None:
-    """Ensure family exists in children_by_family dictionary."""
-    if family_id not in children_by_family:
-        children_by_family[family_id] = []
-
+def _find_person_by_id(person_index: Dict[str, dict], person_id: str) -> dict:
+    """Find person by ID in the person index."""
+    return person_index.get(person_id)
 
-def _add_child_if_valid(context: dict) -> None:
-    """Add child to family if valid."""
-    db_json = context["db_json"]
-    children_by_family = context["children_by_family"]
-    family_id = context["family_id"]
-    child_id = context["child_id"]
-    person_lookup = context["person_lookup"]
 
-    child_person = _find_person_by_id(db_json, child_id)
-    if child_person and child_id in person_lookup:
-        child_data = _create_child_data(child_person, person_lookup[child_id])
-        children_by_family[family_id].append(child_data)
-
-
-def _find_person_by_id(db_json: dict, person_id: str) -> dict:
-    """Find person by ID in the database JSON."""
-    for p in db_json.get("persons", []):
-        if str(p.get("id")) == person_id:
-            return p
-    return None
+# Unknown sexes are exported as male children.
+_CHILD_GENDERS = {"M": "male", "F": "female"}
 
 
 def _create_child_data(child_person: dict, child_name: str) -> dict:
     """Create child data structure."""
-    sex = child_person.get("sex", "M")
-    gender = "male" if sex == "M" else "female" if sex == "F" else "male"
-
+    gender = _CHILD_GENDERS.get(child_person.get("sex"), "male")
     return {"gender": gender, "person": {"raw": child_name}}
 
 
@@ -306,11 +272,10 @@ def _build_families_list(
     db_json: dict, person_lookup: Dict[str, str], children_by_family: Dict[str, list]
 ) -> list:
     """Build families list from database JSON."""
-    families = []
-    for f in db_json.get("families", []):
-        family_data = _create_family_data(f, person_lookup, children_by_family)
-        families.append(family_data)
-    return families
+    return [
+        _create_family_data(f, person_lookup, children_by_family)
+        for f in db_json.get("families", [])
+    ]
 
 
 def _create_family_data(
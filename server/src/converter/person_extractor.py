@@ -6,7 +6,7 @@ Handles extraction of person-specific data from parsed GeneWeb data.
 
 from datetime import date
 from typing import Dict, Any, Optional
-from .date_utils import parse_date_dict_to_date, parse_date_string_to_date
+from .date_utils import YEAR_RE, parse_date_dict_to_date, parse_date_string_to_date
 
 
 def extract_birth_date_from_person_data(person_data: Dict[str, Any]) -> Optional[date]:
@@ -18,19 +18,12 @@ def _extract_date_from_person_data(
     person_data: Dict[str, Any], event_type: str, dates_index: int
 ) -> Optional[date]:
     """Generic function to extract date from person data using multiple strategies."""
-    extractors = [
-        lambda data: _extract_date_from_events(data, event_type),
-        lambda data: _extract_date_from_dates_list(data, dates_index),
-        lambda data: _extract_date_from_tags(data, event_type),
-        lambda data: _extract_date_from_raw_string(data),
-    ]
-
-    for extractor in extractors:
-        date_result = extractor(person_data)
-        if date_result:
-            return date_result
-
-    return None
+    return (
+        _extract_date_from_events(person_data, event_type)
+        or _extract_date_from_dates_list(person_data, dates_index)
+        or _extract_date_from_tags(person_data, event_type)
+        or _extract_date_from_raw_string(person_data)
+    )
 
 
 def _extract_date_from_events(
@@ -70,15 +63,9 @@ def _extract_date_from_raw_string(person_data: Dict[str, Any]) -> Optional[date]
     """Extract date from raw string."""
     raw_string = person_data.get("raw", "")
     if raw_string:
-        import re
-
-        years = re.findall(r"\b(1[0-9]{3}|2[0-9]{3})\b", raw_string)
-        if years:
-            try:
-                year = int(years[0])
-                return date(year, 1, 1)
-            except ValueError:
-                pass
+        year_match = YEAR_RE.search(raw_string)
+        if year_match:
+            return date(int(year_match.group(1)), 1, 1)
     return None
 
 
@@ -211,12 +198,10 @@ def _extract_notes_from_tags(person_data: Dict[str, Any]) -> Optional[str]:
 
 def _extract_notes_from_events(person_data: Dict[str, Any]) -> Optional[str]:
     """Extract notes from events."""
-    events = person_data.get("events", [])
-    event_notes = []
-    for event in events:
-        if "notes" in event and event["notes"]:
-            event_notes.extend(event["notes"])
-
-    if event_notes:
-        return " | ".join(event_notes)
-    return None
+    event_notes = [
+        note
+        for event in person_data.get("events", [])
+        if event.get("notes")
+        for note in event["notes"]
+    ]
+    return " | ".join(event_notes) if event_notes else None
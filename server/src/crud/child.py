@@ -3,10 +3,19 @@
 from typing import List, Optional
 from uuid import UUID
 
+from sqlalchemy import bindparam
 from sqlmodel import Session, select
 
 from ..models.child import Child, ChildCreate
 
+# Built once and reused with bound values, so each call skips constructing the
+# select and regenerating its compiled-cache key.
+_SELECT_BY_FAMILY = select(Child).where(Child.family_id == bindparam("family_id"))
+_SELECT_BY_CHILD = select(Child).where(Child.child_id == bindparam("child_id"))
+_SELECT_ONE = select(Child).where(
+    Child.family_id == bindparam("family_id"), Child.child_id == bindparam("child_id")
+)
+
 
 class ChildCRUD:
     """CRUD operations for Child model."""
@@ -21,20 +30,16 @@ class ChildCRUD:
 
     def get(self, db: Session, family_id: UUID, child_id: UUID) -> Optional[Child]:
         """Get a child relationship by family and child IDs."""
-        statement = select(Child).where(
-            Child.family_id == family_id, Child.child_id == child_id
-        )
-        return db.exec(statement).first()
+        params = {"family_id": family_id, "child_id": child_id}
+        return db.exec(_SELECT_ONE, params=params).first()
 
     def get_by_family(self, db: Session, family_id: UUID) -> List[Child]:
         """Get all children of a family."""
-        statement = select(Child).where(Child.family_id == family_id)
-        return list(db.exec(statement))
+        return list(db.exec(_SELECT_BY_FAMILY, params={"family_id": family_id}))
 
     def get_by_child(self, db: Session, child_id: UUID) -> List[Child]:
         """Get all families where a person is a child."""
-        statement = select(Child).where(Child.child_id == child_id)
-        return list(db.exec(statement))
+        return list(db.exec(_SELECT_BY_CHILD, params={"child_id": child_id}))
 
     def get_all(self, db: Session, skip: int = 0, limit: int = 100) -> List[Child]:
         """Get all child relationships with pagination."""
@@ -43,10 +48,7 @@ class ChildCRUD:
 
     def delete(self, db: Session, family_id: UUID, child_id: UUID) -> bool:
         """Delete a child relationship."""
-        statement = select(Child).where(
-            Child.family_id == family_id, Child.child_id == child_id
-        )
-        db_child = db.exec(statement).first()
+        db_child = self.get(db, family_id, child_id)
         if not db_child:
             return False
 
@@ -56,8 +58,7 @@ class ChildCRUD:
 
     def delete_by_family(self, db: Session, family_id: UUID) -> int:
         """Delete all child relationships for a family."""
-        statement = select(Child).where(Child.family_id == family_id)
-        children = list(db.exec(statement))
+        children = self.get_by_family(db, family_id)
         for child in children:
             db.delete(child)
         db.commit()
@@ -65,8 +66,7 @@ class ChildCRUD:
 
     def delete_by_child(self, db: Session, child_id: UUID) -> int:
         """Delete all family relationships for a child."""
-        statement = select(Child).where(Child.child_id == child_id)
-        children = list(db.exec(statement))
+        children = self.get_by_child(db, child_id)
         for child in children:
             db.delete(child)
         db.commit()
@@ -73,6 +73,39 @@ class FamilyCRUD:
         )
         return list(db.exec(statement).unique())
 
+    def get_by_spouses(
+        self, db: Session, spouse_ids: List[UUID]
+    ) -> dict[UUID, List[Family]]:
+        """Get families for several spouses at once, indexed by spouse ID.
+
+        Runs a single query instead of one ``get_by_spouse`` call per person.
+        A family appears under both its husband and its wife when both are
+        among ``spouse_ids``.
+        """
+        families_by_spouse: dict[UUID, List[Family]] = {}
+        if not spouse_ids:
+            return families_by_spouse
+
+        statement = (
+            select(Family)
+            .where(
+                Family.husband_id.in_(spouse_ids)  # pylint: disable=no-member
+                | Family.wife_id.in_(spouse_ids)  # pylint: disable=no-member
+            )
+            .options(
+                joinedload(Family.husband),
+                joinedload(Family.wife),
+                joinedload(Family.events),
+            )
+        )
+        wanted = set(spouse_ids)
+        for family in db.exec(statement).unique():
+            if family.husband_id in wanted:
+                families_by_spouse.setdefault(family.husband_id, []).append(family)
+            if family.wife_id in wanted and family.wife_id != family.husband_id:
+                families_by_spouse.setdefault(family.wife_id, []).append(family)
+        return families_by_spouse
+
     def update(
         self, db: Session, family_id: UUID, family_update: FamilyUpdate
     ) -> Optional[Family]:
@@ -296,19 +329,26 @@ class FamilyCRUD:
 
     def _process_children_with_families(self, db: Session, children) -> list:
         """Process children and detect cross-family relationships."""
+        families_by_spouse = self.get_by_spouses(
+            db, [child.child.id for child in children if child.child]
+        )
         processed_children = []
         for child in children:
             child_dict = child.model_dump()
             if child.child:
                 child_person = child.child.model_dump()
-                self._add_child_family_info(db, child.child, child_person)
+                self._add_child_family_info(
+                    families_by_spouse, child.child, child_person
+                )
                 child_dict["person"] = child_person
             processed_children.append(child_dict)
         return processed_children
 
-    def _add_child_family_info(self, db: Session, child_person, child_person_dict):
+    def _add_child_family_info(
+        self, families_by_spouse: dict, child_person, child_person_dict
+    ):
         """Add family information for a child person."""
-        child_families = self.get_by_spouse(db, child_person.id)
+        child_families = families_by_spouse.get(child_person.id)
         if child_families:
             child_person_dict["has_own_family"] = True
             child_person_dict["own_families"] = []
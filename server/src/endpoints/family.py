@@ -45,7 +45,6 @@ def _validate_family_relationships_and_dates(
     from ..validators import (
         validate_family_dates,
         validate_family_spouses,
-        FamilyDateData,
     )
 
     validate_family_spouses(family.husband_id, family.wife_id)
@@ -56,15 +55,13 @@ def _validate_family_relationships_and_dates(
     husband = _get_spouse_data(session, family.husband_id)
     wife = _get_spouse_data(session, family.wife_id)
 
-    family_data = FamilyDateData(
+    validate_family_dates(
         marriage_date=family.marriage_date,
-        divorce_date=None,
         husband_birth_date=husband.birth_date if husband else None,
         wife_birth_date=wife.birth_date if wife else None,
         husband_death_date=husband.death_date if husband else None,
         wife_death_date=wife.death_date if wife else None,
     )
-    validate_family_dates(family_data)
 
 
 def _validate_family_update_relationships(
@@ -92,7 +89,6 @@ def _validate_patch_family_relationships_and_dates(
     from ..validators import (
         validate_family_dates,
         validate_family_spouses,
-        FamilyDateData,
     )
 
     update_data = family_update.model_dump(exclude_unset=True)
@@ -118,15 +114,13 @@ def _validate_patch_family_relationships_and_dates(
         family_update.marriage_date, current_family.marriage_date
     )
 
-    family_data = FamilyDateData(
+    validate_family_dates(
         marriage_date=marriage_date,
-        divorce_date=None,
         husband_birth_date=husband.birth_date if husband else None,
         wife_birth_date=wife.birth_date if wife else None,
         husband_death_date=husband.death_date if husband else None,
         wife_death_date=wife.death_date if wife else None,
     )
-    validate_family_dates(family_data)
 
 
 def _prevent_duplicate_couple(session: Session, family: FamilyCreate) -> None:
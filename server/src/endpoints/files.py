@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
 from fastapi.responses import FileResponse, JSONResponse
 from ..geneweb_converter import db_to_json, json_to_db
-from ..converter.json_normalizer import convert_to_json_serializable, normalize_db_json
+from ..converter.json_normalizer import normalize_db_json
 from ..converter.entity_extractor import extract_entities
 from sqlmodel import Session
 from uuid import UUID
@@ -582,10 +582,10 @@ def export_json_data(session: Session = Depends(get_session)):
     children = child_crud.get_all(session)
 
     data = {
-        "persons": [convert_to_json_serializable(p.model_dump()) for p in persons],
-        "families": [convert_to_json_serializable(f.model_dump()) for f in families],
-        "events": [convert_to_json_serializable(e.model_dump()) for e in events],
-        "children": [convert_to_json_serializable(c.model_dump()) for c in children],
+        "persons": [p.model_dump(mode="json") for p in persons],
+        "families": [f.model_dump(mode="json") for f in families],
+        "events": [e.model_dump(mode="json") for e in events],
+        "children": [c.model_dump(mode="json") for c in children],
     }
 
     return JSONResponse(content=data)
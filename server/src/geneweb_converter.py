@@ -118,6 +118,7 @@ def _load_families_with_relationships(session: Session):
 
 
 def _serialize_persons(persons: list, all_events: list) -> list:
+    events_by_person = _index_events_by_person(all_events)
     persons_data = []
     for person in persons:
         person_dict = {
@@ -132,16 +133,17 @@ def _serialize_persons(persons: list, all_events: list) -> list:
             "occupation": person.occupation,
             "notes": person.notes,
         }
-        person_dict["events"] = _events_for_person(all_events, person.id)
+        person_dict["events"] = events_by_person.get(person.id, [])
         persons_data.append(person_dict)
     return persons_data
 
 
-def _events_for_person(all_events: list, person_id) -> list:
-    person_events = []
+def _index_events_by_person(all_events: list) -> Dict[Any, list]:
+    """Group serialized events by person ID in a single pass over all events."""
+    events_by_person: Dict[Any, list] = {}
     for event in all_events:
-        if event.person_id == person_id:
-            person_events.append(
+        if event.person_id:
+            events_by_person.setdefault(event.person_id, []).append(
                 {
                     "id": str(event.id),
                     "type": event.type,
@@ -152,7 +154,7 @@ def _events_for_person(all_events: list, person_id) -> list:
                     "family_id": str(event.family_id) if event.family_id else None,
                 }
             )
-    return person_events
+    return events_by_person
 
 
 def _serialize_families(families: list) -> list:
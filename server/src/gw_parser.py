@@ -74,8 +74,8 @@ class GWParser:
 
     def _read(self) -> None:
         """Read the .gw file into self.lines."""
+        # splitlines() already drops "\n", "\r" and "\r\n" line endings.
         self.lines = self.path.read_text(encoding="utf-8").splitlines()
-        self.lines = [line.rstrip("\n").rstrip("\r") for line in self.lines]
         self.pos = 0
         self.length = len(self.lines)
 
@@ -5,14 +5,23 @@ Handles parsing and interpretation of date tokens and qualifiers.
 """
 
 import re
+from functools import lru_cache
 from typing import Optional
 from .models import DateDict
 
 
 # ===== CONSTANTS =====
 
-DATE_QUAL_RE = re.compile(r"^(?P<qual>[<>\?~]{0,2}|0\(|\|{0,2})(?P<val>.*)$")
+DATE_QUALIFIER_CHARS = "<>?~"
 DATE_TOKEN_PATTERN = re.compile(r"[0-9\/\<\>\~\?\|\.]")  # date-like tokens
+DATE_QUALIFIERS = {
+    "<": "before",
+    "<<": "before",
+    ">": "after",
+    ">>": "after",
+    "~": "approx",
+    "?": "uncertain",
+}
 
 
 def parse_date_token(date_token: str) -> DateDict:
@@ -26,19 +35,21 @@ def parse_date_token(date_token: str) -> DateDict:
         "0(5_Mai_1990)" -> {"raw":"0(5_Mai_1990)","literal":"5 Mai 1990"}
         "10/5/1990|1991" -> {"raw":"10/5/1990|1991","alternatives":["10/5/1990","1991"]}
     """
-    token = date_token.strip()
+    cached = _parse_stripped_date_token(date_token.strip())
+    # Copy so callers can modify the result without altering the cached one.
+    return {
+        key: list(value) if isinstance(value, list) else value
+        for key, value in cached.items()
+    }
+
+
+@lru_cache(maxsize=4096)
+def _parse_stripped_date_token(token: str) -> DateDict:
+    """Parse a stripped date token; results are shared and must not be mutated."""
     if not token:
         return {"raw": token}
 
-    # Try different parsing strategies
-    parsers = [
-        _parse_literal_date,
-        _parse_range_date,
-        _parse_alternatives_date,
-        _parse_qualifier_date,
-    ]
-
-    for parser in parsers:
+    for parser in _DATE_PARSERS:
         result = parser(token)
         if result is not None:
             return result
@@ -72,25 +83,14 @@ def _parse_alternatives_date(token: str) -> Optional[DateDict]:
 
 def _parse_qualifier_date(token: str) -> Optional[DateDict]:
     """Parse qualifier date format."""
-    match = DATE_QUAL_RE.match(token)
-    if not match:
-        return None
-
-    qualifier = match.group("qual") or ""
-    value = match.group("val").strip()
+    # The qualifier is made of at most two leading qualifier characters.
+    qualifier_length = min(2, len(token) - len(token.lstrip(DATE_QUALIFIER_CHARS)))
+    qualifier = token[:qualifier_length]
+    value = token[qualifier_length:].strip()
     date: DateDict = {"raw": token}
 
-    qualifiers_map = {
-        "<": "before",
-        "<<": "before",
-        ">": "after",
-        ">>": "after",
-        "~": "approx",
-        "?": "uncertain",
-    }
-
-    if qualifier in qualifiers_map:
-        date["qualifier"] = qualifiers_map[qualifier]
+    if qualifier in DATE_QUALIFIERS:
+        date["qualifier"] = DATE_QUALIFIERS[qualifier]
         date["value"] = value
     elif value and DATE_TOKEN_PATTERN.search(token):
         date["value"] = value
@@ -98,6 +98,15 @@ def _parse_qualifier_date(token: str) -> Optional[DateDict]:
     return date
 
 
+# Parsing strategies, tried in order by _parse_stripped_date_token.
+_DATE_PARSERS = (
+    _parse_literal_date,
+    _parse_range_date,
+    _parse_alternatives_date,
+    _parse_qualifier_date,
+)
+
+
 def normalize_underscores(s: str) -> str:
     """Replace underscores with spaces in a string, preserving punctuation."""
     return s.replace("_", " ").strip()
@@ -4,7 +4,6 @@ Event parsing utilities for GeneWeb parser.
 Handles parsing of events and related data.
 """
 
-import re
 from typing import Dict, List, Optional, Tuple
 from .models import EventDict
 from .date_parser import parse_date_token, DATE_TOKEN_PATTERN
@@ -28,19 +27,25 @@ def extract_place_and_source(text: str) -> Tuple[Optional[str], List[str]]:
     Returns:
         Tuple: (place_raw, list_of_sources)
     """
-    place_raw = _extract_place_from_text(text)
-    sources = _extract_sources_from_text(text)
+    place_raw, sources = None, []
+    # Every segment after a "#" starts with its tag letter; a bare "#p"/"#s"
+    # with nothing after it is not a tag.
+    for segment in text.split("#")[1:]:
+        if len(segment) < 2:
+            continue
+        if segment[0] == "s":
+            sources.append(segment[1:].strip())
+        elif segment[0] == "p" and place_raw is None:
+            place_raw = segment[1:].strip()
+
+    if place_raw is None:
+        place_raw = _extract_untagged_place(text)
     return place_raw, sources
 
 
-def _extract_place_from_text(text: str) -> Optional[str]:
-    """Extract place from text."""
-    # Look for explicit #p place tag
-    place_match = re.search(r"#p\s*([^#]+)", text)
-    if place_match:
-        return place_match.group(1).strip()
-
-    # If no #p tag, treat text before any # tags as place
+def _extract_untagged_place(text: str) -> Optional[str]:
+    """Extract place from text without an explicit #p tag."""
+    # Treat text before any # tags as place
     first_hash = text.find("#")
     if first_hash > 0:
         return text[:first_hash].strip()
@@ -52,12 +57,6 @@ def _extract_place_from_text(text: str) -> Optional[str]:
     return None
 
 
-def _extract_sources_from_text(text: str) -> List[str]:
-    """Extract sources from text."""
-    source_matches = re.findall(r"#s\s*([^#]+)", text)
-    return [s.strip() for s in source_matches]
-
-
 def parse_event_line(event_line: str, event_type_mapping: Dict[str, str]) -> EventDict:
     """
     Parse an event line into structured EventDict.
@@ -65,15 +64,17 @@ def parse_event_line(event_line: str, event_type_mapping: Dict[str, str]) -> Eve
     Example:
         "#birt 1813 #p Paris #s registry"
     """
-    parts = event_line.strip().split(maxsplit=1)
+    line = event_line.strip()
+    parts = line.split(maxsplit=1)
     tag = parts[0]
-    content = parts[1] if len(parts) > 1 else ""
-    event_type = event_type_mapping.get(tag, tag.lstrip("#"))
+    event_type = event_type_mapping.get(tag)
+    if event_type is None:
+        event_type = tag.lstrip("#")
 
-    parsed: EventDict = {"type": event_type, "raw": event_line.strip()}
+    parsed: EventDict = {"type": event_type, "raw": line}
 
-    if content:
-        _parse_event_content(content, parsed)
+    if len(parts) > 1:
+        _parse_event_content(parts[1], parsed)
 
     return parsed
 
@@ -96,6 +97,5 @@ def _parse_event_content(content: str, parsed: EventDict) -> None:
 
 def parse_note_line(line: str) -> str:
     """Extract note text, removing 'note' prefix."""
-    return (
-        line.strip()[5:].strip() if line.strip().startswith("note ") else line.strip()
-    )
+    line = line.strip()
+    return line[5:].lstrip() if line.startswith("note ") else line
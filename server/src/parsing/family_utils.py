@@ -3,11 +3,12 @@
 import re
 from typing import Tuple, Optional
 
+MARRIAGE_DATE_RE = re.compile(r"\+\d{4}-\d{2}-\d{2}")
+
 
 def split_family_header(header: str) -> Tuple[str, Optional[str]]:
     """Split a family header into husband and wife segments."""
-    marriage_date_pattern = r"\+\d{4}-\d{2}-\d{2}"
-    match = re.search(marriage_date_pattern, header)
+    match = MARRIAGE_DATE_RE.search(header)
 
     if match:
         husband = header[: match.start()].strip()
@@ -45,8 +46,8 @@ def _find_first_name_pair_after(words: list, idx: int) -> Optional[int]:
 def _extract_wife_from_simple_format(header: str) -> Tuple[str, Optional[str]]:
     """Extract wife from simple family format."""
     for sep in (" + ", " +", "+ ", "+"):
-        if sep in header:
-            husband, wife = header.split(sep, 1)
+        husband, found, wife = header.partition(sep)
+        if found:
             return husband.strip(), wife.strip()
     return header.strip(), None
 
@@ -92,4 +93,4 @@ def _extract_name_from_parts(words: list, start_idx: int) -> Optional[str]:
 
 def should_skip_empty_line(line: str) -> bool:
     """Return True if the line is empty or contains only whitespace."""
-    return not line.strip()
+    return not line or line.isspace()
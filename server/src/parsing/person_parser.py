@@ -4,6 +4,7 @@ Person parsing utilities for GeneWeb parser.
 Handles parsing of person segments and related data.
 """
 
+import sys
 from typing import Dict, List, Optional
 from .models import PersonDict
 from .token_parser import (
@@ -37,7 +38,7 @@ def parse_person_segment(segment: str) -> PersonDict:
     sex = _determine_sex_from_tags(tags)
     parsed_tags = _process_tags(tags)
 
-    return {
+    person: PersonDict = {
         "raw": segment,
         "name": full_name,
         "first_name": first_name,
@@ -46,8 +47,10 @@ def parse_person_segment(segment: str) -> PersonDict:
         "display_name": normalize_underscores(full_name) or None,
         "tags": parsed_tags,
         "dates": [parse_date_token(t) for t in date_tokens],
-        **({"other": other_tokens} if other_tokens else {}),
     }
+    if other_tokens:
+        person["other"] = other_tokens
+    return person
 
 
 def _create_empty_person_dict(segment: str) -> PersonDict:
@@ -79,7 +82,11 @@ def _determine_sex_from_tags(tags: Dict[str, List[str]]) -> Optional[str]:
 
 
 def _process_tags(tags: Dict[str, List[str]]) -> Dict[str, List[str]]:
-    """Process tags by removing # prefix and normalizing underscores."""
+    """Process tags by removing # prefix and normalizing underscores.
+
+    Tag names are interned so every person shares one string per tag name.
+    """
     return {
-        k.lstrip("#"): [normalize_underscores(v) for v in vs] for k, vs in tags.items()
+        sys.intern(k.lstrip("#")): [normalize_underscores(v) for v in vs]
+        for k, vs in tags.items()
     }
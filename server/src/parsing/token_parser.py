@@ -4,10 +4,16 @@ Token parsing utilities for GeneWeb parser.
 Handles tokenization and parsing of text segments.
 """
 
+import re
 from typing import List, Tuple
 from .models import TagsDict
 from .date_parser import DATE_TOKEN_PATTERN
 
+# A "{" opens a token that runs to the next "}" (or to the end of the text).
+BRACED_TOKEN_RE = re.compile(r"\{[^}]*\}?|\S+")
+# First characters of a tag or of a token matched by DATE_TOKEN_PATTERN.
+NAME_STOP_CHARS = frozenset("#0123456789/<>~?|.")
+
 
 def tokenize_preserving_braces(text: str) -> List[str]:
     """
@@ -17,37 +23,7 @@ def tokenize_preserving_braces(text: str) -> List[str]:
         "Jean-Baptiste {Jean-Baptiste_Laurent} #occu ..."
         → keeps "{...}" together.
     """
-    tokens, i = [], 0
-    while i < len(text):
-        if text[i].isspace():
-            i += 1
-            continue
-
-        if text[i] == "{":
-            token, i = _extract_braced_token(text, i)
-        else:
-            token, i = _extract_regular_token(text, i)
-
-        tokens.append(token)
-    return tokens
-
-
-def _extract_braced_token(text: str, start: int) -> Tuple[str, int]:
-    """Extract token inside braces."""
-    i = start + 1
-    while i < len(text) and text[i] != "}":
-        i += 1
-    if i < len(text):
-        i += 1
-    return text[start:i], i
-
-
-def _extract_regular_token(text: str, start: int) -> Tuple[str, int]:
-    """Extract regular token (not in braces)."""
-    i = start
-    while i < len(text) and not text[i].isspace():
-        i += 1
-    return text[start:i], i
+    return BRACED_TOKEN_RE.findall(text)
 
 
 def extract_tags_and_dates_from_tokens(
@@ -63,25 +39,23 @@ def extract_tags_and_dates_from_tokens(
     date_tokens: List[str] = []
     other_tokens: List[str] = []
 
-    i = 0
-    while i < len(tokens):
-        token = tokens[i]
-
+    # Every token after the first tag belongs to the value of the latest tag.
+    tag_key = None
+    value_parts: List[str] = []
+    for token in tokens:
         if token.startswith("#"):
-            tag_key = token
-            value_parts = []
-            i += 1
-            while i < len(tokens) and not tokens[i].startswith("#"):
-                value_parts.append(tokens[i])
-                i += 1
-            tags.setdefault(tag_key, []).append(" ".join(value_parts).strip())
-            continue
-
-        if DATE_TOKEN_PATTERN.search(token):
+            if tag_key is not None:
+                tags.setdefault(tag_key, []).append(" ".join(value_parts).strip())
+            tag_key, value_parts = token, []
+        elif tag_key is not None:
+            value_parts.append(token)
+        elif DATE_TOKEN_PATTERN.search(token):
             date_tokens.append(token)
         else:
             other_tokens.append(token)
-        i += 1
+
+    if tag_key is not None:
+        tags.setdefault(tag_key, []).append(" ".join(value_parts).strip())
 
     return tags, date_tokens, other_tokens
 
@@ -93,15 +67,10 @@ def extract_name_tokens(tokens: List[str]) -> Tuple[List[str], List[str]]:
     Returns:
         Tuple: (name_tokens, remaining_tokens)
     """
-    name_tokens = []
-    i = 0
-    while i < len(tokens):
-        tk = tokens[i]
-        if tk.startswith("#") or DATE_TOKEN_PATTERN.match(tk):
-            break
-        name_tokens.append(tk)
-        i += 1
-    return name_tokens, tokens[i:]
+    for i, tk in enumerate(tokens):
+        if tk and tk[0] in NAME_STOP_CHARS:
+            return tokens[:i], tokens[i:]
+    return tokens[:], []
 
 
 def split_name_into_parts(full_name: str) -> Tuple[str, str]:
@@ -114,15 +83,10 @@ def split_name_into_parts(full_name: str) -> Tuple[str, str]:
     Returns:
         Tuple of (first_name, last_name)
     """
-    if not full_name or not full_name.strip():
-        return "", ""
-
-    name_parts = full_name.strip().split()
+    name_parts = full_name.split(None, 1) if full_name else []
 
-    if len(name_parts) == 0:
+    if not name_parts:
         return "", ""
     if len(name_parts) == 1:
         return name_parts[0], ""
-    first_name = name_parts[0]
-    last_name = " ".join(name_parts[1:])
-    return first_name, last_name
+    return name_parts[0], " ".join(name_parts[1].split())
@@ -17,6 +17,9 @@ from .person_serializer import serialize_person
 from .event_serializer import serialize_event
 from .sources_serializer import serialize_sources
 
+# Child genders written as "h"/"f"; any other value is already a prefix.
+CHILD_PREFIXES = {"male": "h", "female": "f"}
+
 
 def serialize_family(family: Dict[str, Any]) -> str:
     """
@@ -68,15 +71,6 @@ def _add_family_children(lines: list, family: Dict[str, Any]) -> None:
     lines.append("beg")
     for child in family.get("children", []):
         gender = child.get("gender", "h")
-        prefix = _get_child_prefix(gender)
+        prefix = CHILD_PREFIXES.get(gender, gender)
         lines.append(f"- {prefix} {serialize_person(child['person'], raw=True)}")
     lines.append("end")
-
-
-def _get_child_prefix(gender: str) -> str:
-    """Get the appropriate prefix for a child based on gender."""
-    if gender == "male":
-        return "h"
-    if gender == "female":
-        return "f"
-    return gender
@@ -14,7 +14,9 @@ Classes:
     - GWSerializer: Main serializer for GeneWeb data
 """
 
-from typing import Dict, Any
+import os
+import tempfile
+from typing import Dict, Any, Iterator
 from .family_serializer import serialize_family
 from .notes_serializer import serialize_notes_db, serialize_notes
 from .page_serializer import serialize_pages
@@ -46,29 +48,33 @@ class GWSerializer:
         Returns:
             str: Complete GeneWeb `.gw` file content.
         """
-        output_lines = []
+        return "\n\n".join(self.iter_sections())
 
+    def iter_sections(self) -> Iterator[str]:
+        """
+        Yield the `.gw` file sections one at a time, in file order.
+
+        Sections are separated by a blank line in the serialized output.
+        """
         # Serialize header first
-        self._serialize_header(output_lines)
+        yield from self._serialize_header()
 
         # Serialize families
-        self._serialize_families(output_lines)
+        yield from self._serialize_families()
 
         # Serialize person events (pevt blocks)
-        self._serialize_people_events(output_lines)
+        yield from self._serialize_people_events()
 
         # Serialize notes
-        self._serialize_notes(output_lines)
+        yield from self._serialize_notes()
 
         # Serialize extended pages
-        self._serialize_pages(output_lines)
+        yield from self._serialize_pages()
 
         # Serialize database notes
-        self._serialize_notes_db(output_lines)
+        yield from self._serialize_notes_db()
 
-        return "\n\n".join(output_lines)
-
-    def _serialize_header(self, output_lines: list) -> None:
+    def _serialize_header(self) -> Iterator[str]:
         """Serialize file header."""
         header_lines = []
 
@@ -81,24 +87,24 @@ class GWSerializer:
             header_lines.append("gwplus")
 
         if header_lines:
-            output_lines.append("\n".join(header_lines))
+            yield "\n".join(header_lines)
 
-    def _serialize_families(self, output_lines: list) -> None:
+    def _serialize_families(self) -> Iterator[str]:
         """Serialize families section."""
         for family in self.data.get("families", []):
-            output_lines.append(serialize_family(family))
+            yield serialize_family(family)
 
-    def _serialize_sources(self, output_lines: list) -> None:
+    def _serialize_sources(self) -> Iterator[str]:
         """Serialize sources section."""
         if "sources" in self.data:
-            output_lines.append(serialize_sources(self.data["sources"]))
+            yield serialize_sources(self.data["sources"])
 
-    def _serialize_people_events(self, output_lines: list) -> None:
+    def _serialize_people_events(self) -> Iterator[str]:
         """Serialize people events section."""
         if "persons" in self.data:
             pevts_dict = self._build_pevts_dict()
             if pevts_dict:
-                output_lines.append(serialize_pevts(pevts_dict))
+                yield serialize_pevts(pevts_dict)
 
     def _build_pevts_dict(self) -> Dict[str, Any]:
         """Build person events dictionary."""
@@ -118,33 +124,46 @@ class GWSerializer:
                 pevts_dict[person_name] = person_events
         return pevts_dict
 
-    def _serialize_notes_db(self, output_lines: list) -> None:
+    def _serialize_notes_db(self) -> Iterator[str]:
         """Serialize notes database section."""
         if "notes_db" in self.data:
-            output_lines.append(serialize_notes_db(self.data["notes_db"]))
+            yield serialize_notes_db(self.data["notes_db"])
 
-    def _serialize_notes(self, output_lines: list) -> None:
+    def _serialize_notes(self) -> Iterator[str]:
         """Serialize individual notes section."""
         if "notes" in self.data:
-            output_lines.append(serialize_notes(self.data["notes"]))
+            yield serialize_notes(self.data["notes"])
 
-    def _serialize_pages(self, output_lines: list) -> None:
+    def _serialize_pages(self) -> Iterator[str]:
         """Serialize extended pages section."""
         if "extended_pages" in self.data and self.data["extended_pages"]:
-            output_lines.append(serialize_pages(self.data["extended_pages"]))
+            yield serialize_pages(self.data["extended_pages"])
 
-    def _serialize_database_notes(self, output_lines: list) -> None:
+    def _serialize_database_notes(self) -> Iterator[str]:
         """Serialize database notes section."""
         if "database_notes" in self.data:
-            output_lines.append(serialize_notes_db(self.data["database_notes"]))
+            yield serialize_notes_db(self.data["database_notes"])
 
     def to_file(self, path: str) -> None:
         """
         Serialize and save to a file.
 
+        Sections are streamed to a temporary file next to ``path`` that
+        replaces it only once every section has been written, so a failing
+        section leaves an existing file untouched.
+
         Args:
             path (str): Path to save the `.gw` file.
         """
-        serialized = self.serialize()
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(serialized)
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                for index, section in enumerate(self.iter_sections()):
+                    if index:
+                        f.write("\n\n")
+                    f.write(section)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -27,8 +27,7 @@ def serialize_notes_db(notes_db: Dict[str, str]) -> str:
         str: GeneWeb `.gw` formatted notes-db block.
     """
     lines = ["notes-db"]
-    for key, value in notes_db.items():
-        lines.append(f"  {key}={value}")
+    lines.extend(f"  {key}={value}" for key, value in notes_db.items())
     return "\n".join(lines)
 
 
@@ -26,15 +26,14 @@ def serialize_pages(pages: Dict[str, Dict[str, str]]) -> str:
     Returns:
         str: GeneWeb-formatted extended pages as a single string.
     """
-    all_blocks = []
+    lines = []
 
     for page_name, content in pages.items():
-        block_lines = []
-        block_lines.append(f'# extended page "{page_name}" used by:')
-        block_lines.append(f"page-ext {page_name}")
-        for k, v in content.items():
-            block_lines.append(f"{k}={v}")
-        block_lines.append("end page-ext")
-        all_blocks.append("\n".join(block_lines))
-
-    return "\n\n".join(all_blocks)
+        if lines:
+            lines.append("")
+        lines.append(f'# extended page "{page_name}" used by:')
+        lines.append(f"page-ext {page_name}")
+        lines.extend(f"{k}={v}" for k, v in content.items())
+        lines.append("end page-ext")
+
+    return "\n".join(lines)
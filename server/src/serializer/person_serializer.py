@@ -13,7 +13,7 @@ Functions:
     - serialize_person_events: Serializes a person's events into GeneWeb `.gw` format
 """
 
-from typing import Dict, Any
+from typing import Any, Dict, List
 
 from .event_serializer import serialize_event
 from .utils import serialize_tags, serialize_dates
@@ -49,10 +49,12 @@ def serialize_person_events(person: Dict[str, Any]) -> str:
     Returns:
         str: GeneWeb-formatted pevt block or empty string if no events.
     """
-    lines = []
-    if "events" in person and person["events"]:
-        lines.append(f"pevt {person['name']}")
-        for event in person["events"]:
-            lines.append(serialize_event(event))
-        lines.append("end pevt")
-    return "\n".join(lines)
+    return "\n".join(_serialize_person_events_lines(person))
+
+
+def _serialize_person_events_lines(person: Dict[str, Any]) -> List[str]:
+    """Build the lines of a person's pevt block, or no lines if no events."""
+    events = person.get("events")
+    if not events:
+        return []
+    return [f"pevt {person['name']}", *map(serialize_event, events), "end pevt"]
@@ -31,8 +31,6 @@ def serialize_pevts(pevts: Dict[str, List[Dict[str, Any]]]) -> str:
     lines = []
     for person_name, events in pevts.items():
         lines.append(f"pevt {person_name}")
-        for event in events:
-            event_str = serialize_event(event)
-            lines.append(event_str)
+        lines.extend(map(serialize_event, events))
         lines.append("end pevt")
     return "\n".join(lines)
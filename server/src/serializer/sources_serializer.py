@@ -43,15 +43,12 @@ def _serialize_family_sources(lines: list, sources: Dict[str, List[str]]) -> Non
     """Serialize family-level sources."""
     family_sources = sources.get("family_source")
     if isinstance(family_sources, list):
-        for src in family_sources:
-            lines.append(f"src {src}")
-        for csrc in family_sources:
-            lines.append(f"csrc {csrc}")
+        lines.extend(f"src {src}" for src in family_sources)
+        lines.extend(f"csrc {csrc}" for csrc in family_sources)
 
 
 def _serialize_children_sources(lines: list, sources: Dict[str, List[str]]) -> None:
     """Serialize children-level sources."""
     children_sources = sources.get("children_source")
     if isinstance(children_sources, list):
-        for csrc in children_sources:
-            lines.append(f"csources {csrc}")
+        lines.extend(f"csources {csrc}" for csrc in children_sources)
@@ -16,6 +16,9 @@ Functions:
 
 from typing import Dict, List
 
+# Lowercased gender values written as "f"; everything else is written as "h".
+FEMALE_GENDERS = frozenset({"f", "female", "woman", "femme"})
+
 
 def serialize_tags(tags: Dict[str, List[str]]) -> List[str]:
     """
@@ -27,11 +30,7 @@ def serialize_tags(tags: Dict[str, List[str]]) -> List[str]:
     Returns:
         List[str]: List of GeneWeb-formatted tag strings.
     """
-    parts = []
-    for tag, values in tags.items():
-        for value in values:
-            parts.append(f"#{tag} {value}")
-    return parts
+    return [f"#{tag} {value}" for tag, values in tags.items() for value in values]
 
 
 def serialize_dates(dates: List[str]) -> List[str]:
@@ -64,11 +63,6 @@ def gender_prefix(gender: str) -> str:
     Returns:
         str: GeneWeb gender prefix ('h' or 'f').
     """
-    if not gender:
-        return "h"
-    gender = gender.lower()
-    if gender in ["m", "male", "man", "homme", "h"]:
-        return "h"
-    if gender in ["f", "female", "woman", "femme"]:
+    if gender and gender.lower() in FEMALE_GENDERS:
         return "f"
     return "h"
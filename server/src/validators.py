@@ -1,48 +1,60 @@
 """Validation functions for genealogy data."""
 
 from datetime import date
-from typing import Optional, NamedTuple
+from typing import NoReturn, Optional
 
 from fastapi import HTTPException
 
-
-class FamilyDateData(NamedTuple):
-    """Data structure for family date validation."""
-
-    marriage_date: Optional[date]
-    divorce_date: Optional[date]
-    husband_birth_date: Optional[date]
-    wife_birth_date: Optional[date]
-    husband_death_date: Optional[date]
-    wife_death_date: Optional[date]
-
-
-def _validate_date_not_future(date_value: Optional[date], field_name: str) -> None:
-    """Helper function to validate that a date is not in the future."""
-    if date_value and date_value > date.today():
-        raise HTTPException(
-            status_code=400, detail=f"{field_name} cannot be in the future"
-        )
-
-
-def _validate_date_after(
-    later_date: Optional[date], earlier_date: Optional[date], error_message: str
-) -> None:
-    """Generic helper function to validate that one date is after another."""
-    if not later_date or not earlier_date:
-        return
-
-    if later_date < earlier_date:
-        raise HTTPException(status_code=400, detail=error_message)
-
-
-def _validate_death_after_birth(
-    birth_date: Optional[date], death_date: Optional[date]
-) -> None:
-    """Helper function to validate that death date is after birth date."""
-    _validate_date_after(
-        death_date, birth_date, "Death date cannot be before birth date"
-    )
+_ERR = {
+    "birth_future": (400, "Birth date cannot be in the future"),
+    "death_future": (400, "Death date cannot be in the future"),
+    "death_before_birth": (400, "Death date cannot be before birth date"),
+    "marriage_future": (400, "Marriage date cannot be in the future"),
+    "divorce_future": (400, "Divorce date cannot be in the future"),
+    "divorce_before_marriage": (400, "Divorce date cannot be before marriage date"),
+    "marriage_before_husband_birth": (
+        400,
+        "Marriage date cannot be before husband's birth date",
+    ),
+    "marriage_before_wife_birth": (
+        400,
+        "Marriage date cannot be before wife's birth date",
+    ),
+    "marriage_after_husband_death": (
+        400,
+        "Marriage date cannot be after husband's death date",
+    ),
+    "marriage_after_wife_death": (
+        400,
+        "Marriage date cannot be after wife's death date",
+    ),
+    "event_future": (400, "Event date cannot be in the future"),
+    "event_before_birth": (400, "Event date cannot be before person's birth date"),
+    "event_after_death": (400, "Event date cannot be after person's death date"),
+    "first_name_empty": (422, "First name cannot be empty"),
+    "last_name_empty": (422, "Last name cannot be empty"),
+    "no_spouse": (422, "At least one spouse (husband or wife) must be provided"),
+    "same_spouse": (400, "Same person cannot be both husband and wife"),
+    "event_both_owners": (
+        400,
+        "Event cannot be associated with both a person and a family",
+    ),
+    "event_no_owner": (
+        400,
+        "Event must be associated with either a person or a family",
+    ),
+}
+
+
+def _raise(key: str) -> NoReturn:
+    """Raise the HTTPException registered under ``key`` in ``_ERR``."""
+    status_code, detail = _ERR[key]
+    raise HTTPException(status_code=status_code, detail=detail)
+
+
+def _today() -> date:
+    """Return today's wall-clock date."""
+    return date.today()
 
 
 def validate_person_dates(
@@ -50,84 +62,45 @@ def validate_person_dates(
     death_date: Optional[date] = None,
 ) -> None:
     """Validate person birth and death dates."""
-    _validate_date_not_future(birth_date, "Birth date")
-    _validate_date_not_future(death_date, "Death date")
-    _validate_death_after_birth(birth_date, death_date)
-
-
-def _validate_marriage_after_birth(
-    marriage_date: Optional[date], birth_date: Optional[date], spouse_role: str
-) -> None:
-    """Helper function to validate that marriage is after birth."""
-    _validate_date_after(
-        marriage_date,
-        birth_date,
-        f"Marriage date cannot be before {spouse_role}'s birth date",
-    )
-
-
-def _validate_marriage_before_death(
-    marriage_date: Optional[date], death_date: Optional[date], spouse_role: str
+    today = _today()
+    if birth_date is not None and birth_date > today:
+        _raise("birth_future")
+    if death_date is not None and death_date > today:
+        _raise("death_future")
+    if birth_date is not None and death_date is not None and death_date < birth_date:
+        _raise("death_before_birth")
+
+
+def validate_family_dates(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    marriage_date: Optional[date] = None,
+    divorce_date: Optional[date] = None,
+    husband_birth_date: Optional[date] = None,
+    wife_birth_date: Optional[date] = None,
+    husband_death_date: Optional[date] = None,
+    wife_death_date: Optional[date] = None,
 ) -> None:
-    """Helper function to validate that marriage is before death."""
-    _validate_date_after(
-        death_date,
-        marriage_date,
-        f"Marriage date cannot be after {spouse_role}'s death date",
-    )
-
-
-def _validate_divorce_after_marriage(
-    marriage_date: Optional[date], divorce_date: Optional[date]
-) -> None:
-    """Helper function to validate that divorce is after marriage."""
-    _validate_date_after(
-        divorce_date, marriage_date, "Divorce date cannot be before marriage date"
-    )
-
-
-def validate_family_dates(family_data: FamilyDateData) -> None:
-    """Validate family dates."""
-    _validate_family_dates_internal(family_data)
-
-
-def _validate_family_dates_internal(family_data: FamilyDateData) -> None:
-    """Internal validation function for family dates."""
-    _validate_date_not_future(family_data.marriage_date, "Marriage date")
-    _validate_date_not_future(family_data.divorce_date, "Divorce date")
-    _validate_divorce_after_marriage(
-        family_data.marriage_date, family_data.divorce_date
-    )
-    _validate_marriage_after_birth(
-        family_data.marriage_date, family_data.husband_birth_date, "husband"
-    )
-    _validate_marriage_after_birth(
-        family_data.marriage_date, family_data.wife_birth_date, "wife"
-    )
-    _validate_marriage_before_death(
-        family_data.marriage_date, family_data.husband_death_date, "husband"
-    )
-    _validate_marriage_before_death(
-        family_data.marriage_date, family_data.wife_death_date, "wife"
-    )
-
-
-def _validate_event_after_birth(
-    event_date: Optional[date], person_birth_date: Optional[date]
-) -> None:
-    """Helper function to validate that event is after person's birth."""
-    _validate_date_after(
-        event_date, person_birth_date, "Event date cannot be before person's birth date"
-    )
-
+    """Validate family dates.
+
+    Every check except the divorce date one is relative to the marriage date,
+    so they are all skipped at once when the marriage date is unknown.
+    """
+    today = _today()
+    marriage_in_future = marriage_date is not None and marriage_date > today
+    if marriage_in_future or (divorce_date is not None and divorce_date > today):
+        _raise("marriage_future" if marriage_in_future else "divorce_future")
+    if marriage_date is None:
+        return
 
-def _validate_event_before_death(
-    event_date: Optional[date], person_death_date: Optional[date]
-) -> None:
-    """Helper function to validate that event is before person's death."""
-    _validate_date_after(
-        person_death_date, event_date, "Event date cannot be after person's death date"
-    )
+    if divorce_date is not None and divorce_date < marriage_date:
+        _raise("divorce_before_marriage")
+    if husband_birth_date is not None and marriage_date < husband_birth_date:
+        _raise("marriage_before_husband_birth")
+    if wife_birth_date is not None and marriage_date < wife_birth_date:
+        _raise("marriage_before_wife_birth")
+    if husband_death_date is not None and husband_death_date < marriage_date:
+        _raise("marriage_after_husband_death")
+    if wife_death_date is not None and wife_death_date < marriage_date:
+        _raise("marriage_after_wife_death")
 
 
 def validate_event_dates(
@@ -136,9 +109,15 @@ def validate_event_dates(
     person_death_date: Optional[date] = None,
 ) -> None:
     """Validate event dates."""
-    _validate_date_not_future(event_date, "Event date")
-    _validate_event_after_birth(event_date, person_birth_date)
-    _validate_event_before_death(event_date, person_death_date)
+    if event_date is None:
+        return
+
+    if event_date > _today():
+        _raise("event_future")
+    if person_birth_date is not None and event_date < person_birth_date:
+        _raise("event_before_birth")
+    if person_death_date is not None and person_death_date < event_date:
+        _raise("event_after_death")
 
 
 def validate_person_names(
@@ -146,35 +125,11 @@ def validate_person_names(
     last_name: Optional[str] = None,
 ) -> None:
     """Validate person names."""
-    if first_name is not None and first_name.strip() == "":
-        raise HTTPException(status_code=422, detail="First name cannot be empty")
+    if first_name is not None and (not first_name or first_name.isspace()):
+        _raise("first_name_empty")
 
-    if last_name is not None and last_name.strip() == "":
-        raise HTTPException(status_code=422, detail="Last name cannot be empty")
-
-
-def _validate_not_same_spouse(
-    husband_id: Optional[str], wife_id: Optional[str]
-) -> None:
-    """Helper function to validate that husband and wife are not the same person."""
-    if not husband_id or not wife_id:
-        return
-
-    if husband_id == wife_id:
-        raise HTTPException(
-            status_code=400, detail="Same person cannot be both husband and wife"
-        )
-
-
-def _validate_at_least_one_spouse(
-    husband_id: Optional[str], wife_id: Optional[str]
-) -> None:
-    """Helper function to validate that at least one spouse is provided."""
-    if not husband_id and not wife_id:
-        raise HTTPException(
-            status_code=422,
-            detail="At least one spouse (husband or wife) must be provided",
-        )
+    if last_name is not None and (not last_name or last_name.isspace()):
+        _raise("last_name_empty")
 
 
 def validate_family_spouses(
@@ -182,8 +137,11 @@ def validate_family_spouses(
     wife_id: Optional[str] = None,
 ) -> None:
     """Validate family spouse relationships."""
-    _validate_not_same_spouse(husband_id, wife_id)
-    _validate_at_least_one_spouse(husband_id, wife_id)
+    if not husband_id:
+        if not wife_id:
+            _raise("no_spouse")
+    elif husband_id == wife_id:
+        _raise("same_spouse")
 
 
 def validate_event_relationships(
@@ -191,14 +149,5 @@ def validate_event_relationships(
     family_id: Optional[str] = None,
 ) -> None:
     """Validate event relationships."""
-    if person_id and family_id:
-        raise HTTPException(
-            status_code=400,
-            detail="Event cannot be associated with both a person and a family",
-        )
-
-    if not person_id and not family_id:
-        raise HTTPException(
-            status_code=400,
-            detail="Event must be associated with either a person or a family",
-        )
+    if bool(person_id) == bool(family_id):
+        _raise("event_both_owners" if person_id else "event_no_owner")
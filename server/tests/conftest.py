@@ -1,48 +1,132 @@
 import os
 import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import StaticPool
 from sqlmodel import SQLModel, create_engine, Session
 from fastapi.testclient import TestClient
 
 from src.main import app
 from src.db import get_session
+from src.crud.person import person_crud
+from src.crud.family import family_crud
+from src.crud.child import child_crud
+from src.crud.event import event_crud
 from src.models.person import Person, PersonCreate, Sex
 from src.models.family import Family, FamilyCreate
 from src.models.child import Child, ChildCreate
 from src.models.event import Event, EventCreate
 
-
 TEST_DATABASE_URL = os.getenv(
-    "TEST_DATABASE_URL", os.getenv("DATABASE_URL", "postgresql:///./test.db")
+    "TEST_DATABASE_URL", os.getenv("DATABASE_URL", "sqlite:///:memory:")
 )
+# Set by pytest-xdist ("gw0", "gw1", ...) when running with ``-n``.
+XDIST_WORKER = os.getenv("PYTEST_XDIST_WORKER")
+WORKER_SCHEMA = f"test_{XDIST_WORKER}" if XDIST_WORKER else None
+
+
+def _create_test_engine(url: str):
+    """Create the test engine, keeping SQLite databases in a single connection.
+
+    Under pytest-xdist each worker gets its own PostgreSQL schema or SQLite
+    file; in-memory SQLite databases are already private to each worker.
+    """
+    if not url.startswith("sqlite"):
+        if WORKER_SCHEMA is None:
+            return create_engine(url, echo=False)
+        return create_engine(
+            url,
+            echo=False,
+            connect_args={"options": f"-csearch_path={WORKER_SCHEMA}"},
+        )
+
+    sqlite_url = make_url(url)
+    if XDIST_WORKER and sqlite_url.database not in (None, "", ":memory:"):
+        root, ext = os.path.splitext(sqlite_url.database)
+        url = sqlite_url.set(database=f"{root}_{XDIST_WORKER}{ext}")
+
+    engine = create_engine(
+        url,
+        echo=False,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
 
-test_engine = create_engine(TEST_DATABASE_URL, echo=False)
+    @event.listens_for(engine, "connect")
+    def _configure_sqlite_connection(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+        # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs nest correctly.
+        dbapi_connection.isolation_level = None
 
+    @event.listens_for(engine, "begin")
+    def _begin_sqlite_transaction(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+test_engine = _create_test_engine(TEST_DATABASE_URL)
+
+
+@pytest.fixture(scope="session")
+def test_schema():
+    """Create the database schema once for the whole test session."""
+    worker_schema = None if test_engine.dialect.name == "sqlite" else WORKER_SCHEMA
+    if worker_schema:
+        with test_engine.begin() as connection:
+            connection.exec_driver_sql(f'CREATE SCHEMA IF NOT EXISTS "{worker_schema}"')
 
-@pytest.fixture(scope="function")
-def test_db():
-    """Create a fresh test database for each test."""
     SQLModel.metadata.create_all(test_engine)
+    yield
+    SQLModel.metadata.drop_all(test_engine)
 
-    with Session(test_engine) as session:
+    if worker_schema:
+        with test_engine.begin() as connection:
+            connection.exec_driver_sql(
+                f'DROP SCHEMA IF EXISTS "{worker_schema}" CASCADE'
+            )
+
+
+@pytest.fixture(scope="function")
+def test_db(test_schema):
+    """Provide a session whose changes are rolled back after each test.
+
+    The session works inside a SAVEPOINT of an outer transaction: commits
+    release the SAVEPOINT and open a new one, rollbacks (e.g. after an
+    IntegrityError) only undo the current one, and the outer transaction
+    is rolled back on teardown.
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+
+    with Session(bind=connection, join_transaction_mode="create_savepoint") as session:
         yield session
 
-    SQLModel.metadata.drop_all(test_engine)
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="module")
+def _client_base():
+    """Create the test client once per test module."""
+    return TestClient(app)
 
 
 @pytest.fixture(scope="function")
-def client(test_db):
-    """Create a test client with database dependency override."""
+def client(_client_base, test_db):
+    """Provide the test client with database dependency override."""
 
     def get_test_session():
         yield test_db
 
     app.dependency_overrides[get_session] = get_test_session
-    client = TestClient(app)
-    yield client
+    yield _client_base
     app.dependency_overrides.clear()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_person_data():
     """Sample person data for testing."""
     return PersonCreate(
@@ -56,7 +140,7 @@ def sample_person_data():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_person_data_2():
     """Second sample person data for testing."""
     return PersonCreate(
@@ -70,7 +154,7 @@ def sample_person_data_2():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_family_data():
     """Sample family data for testing."""
     return FamilyCreate(
@@ -78,7 +162,7 @@ def sample_family_data():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_event_data():
     """Sample event data for testing."""
     return EventCreate(
@@ -89,24 +173,18 @@ def sample_event_data():
 @pytest.fixture
 def sample_person(test_db, sample_person_data):
     """Create a sample person in the test database."""
-    from src.crud.person import person_crud
-
     return person_crud.create(test_db, sample_person_data)
 
 
 @pytest.fixture
 def sample_person_2(test_db, sample_person_data_2):
     """Create a second sample person in the test database."""
-    from src.crud.person import person_crud
-
     return person_crud.create(test_db, sample_person_data_2)
 
 
 @pytest.fixture
 def sample_family(test_db, sample_family_data, sample_person, sample_person_2):
     """Create a sample family in the test database."""
-    from src.crud.family import family_crud
-
     family_data = FamilyCreate(
         husband_id=sample_person.id,
         wife_id=sample_person_2.id,
@@ -121,8 +199,6 @@ def sample_family(test_db, sample_family_data, sample_person, sample_person_2):
 @pytest.fixture
 def sample_child(test_db, sample_family, sample_person):
     """Create a sample child relationship in the test database."""
-    from src.crud.child import child_crud
-
     child_data = ChildCreate(family_id=sample_family.id, child_id=sample_person.id)
 
     return child_crud.create(test_db, child_data)
@@ -131,8 +207,6 @@ def sample_child(test_db, sample_family, sample_person):
 @pytest.fixture
 def sample_event(test_db, sample_event_data, sample_person):
     """Create a sample event in the test database."""
-    from src.crud.event import event_crud
-
     event_data = EventCreate(
         person_id=sample_person.id,
         type="Birth",
@@ -6,6 +6,10 @@ import pytest
 from datetime import date
 from src.converter.entity_extractor import extract_entities
 
+# extract_entities sets "gender" on spouse dicts, so tests pass copies.
+JOHN = {"first_name": "John", "last_name": "Doe", "sex": "M"}
+JANE = {"first_name": "Jane", "last_name": "Smith", "sex": "F"}
+
 
 class TestExtractEntities:
     """Test the extract_entities function."""
@@ -92,8 +96,8 @@ class TestExtractEntities:
             "families": [
                 {
                     "id": "fam1",
-                    "husband": {"first_name": "John", "last_name": "Doe", "sex": "M"},
-                    "wife": {"first_name": "Jane", "last_name": "Smith", "sex": "F"},
+                    "husband": {**JOHN},
+                    "wife": {**JANE},
                 }
             ]
         }
@@ -121,8 +125,8 @@ class TestExtractEntities:
             "families": [
                 {
                     "id": "fam1",
-                    "husband": {"first_name": "John", "last_name": "Doe", "sex": "M"},
-                    "wife": {"first_name": "Jane", "last_name": "Smith", "sex": "F"},
+                    "husband": {**JOHN},
+                    "wife": {**JANE},
                     "children": [
                         {
                             "person": {
@@ -161,7 +165,7 @@ class TestExtractEntities:
             "families": [
                 {
                     "id": "fam1",
-                    "husband": {"first_name": "John", "last_name": "Doe", "sex": "M"},
+                    "husband": {**JOHN},
                     "events": [
                         {"type": "marriage", "date": "2020-01-01", "place": "Paris"},
                         {"type": "divorce", "date": "2022-01-01"},
@@ -185,11 +189,7 @@ class TestExtractEntities:
 
     def test_extract_entities_family_without_id(self):
         """Test extraction with family without ID (should generate one)."""
-        parsed = {
-            "families": [
-                {"husband": {"first_name": "John", "last_name": "Doe", "sex": "M"}}
-            ]
-        }
+        parsed = {"families": [{"husband": {**JOHN}}]}
         result = extract_entities(parsed)
 
         assert len(result["families"]) == 1
@@ -203,11 +203,11 @@ class TestExtractEntities:
             "families": [
                 {
                     "id": "fam1",
-                    "husband": {"first_name": "John", "last_name": "Doe", "sex": "M"},
+                    "husband": {**JOHN},
                 },
                 {
                     "id": "fam2",
-                    "wife": {"first_name": "Jane", "last_name": "Smith", "sex": "F"},
+                    "wife": {**JANE},
                 },
             ]
         }
@@ -228,7 +228,7 @@ class TestExtractEntities:
             "families": [
                 {
                     "id": "fam1",
-                    "husband": {"first_name": "John", "last_name": "Doe", "sex": "M"},
+                    "husband": {**JOHN},
                     "children": [
                         {
                             "person": {
@@ -258,7 +258,7 @@ class TestExtractEntities:
             "families": [
                 {
                     "id": "fam1",
-                    "husband": {"first_name": "John", "last_name": "Doe", "sex": "M"},
+                    "husband": {**JOHN},
                     "children": [
                         {
                             "person": {
@@ -286,8 +286,8 @@ class TestExtractEntities:
             "families": [
                 {
                     "id": "fam1",
-                    "husband": {"first_name": "John", "last_name": "Doe", "sex": "M"},
-                    "wife": {"first_name": "Jane", "last_name": "Smith", "sex": "F"},
+                    "husband": {**JOHN},
+                    "wife": {**JANE},
                     "events": [
                         {"type": "marriage", "date": "2020-01-01", "place": "Paris"}
                     ],
@@ -11,9 +11,8 @@ from src.converter.json_normalizer import (
     _build_person_lookup,
     _build_children_by_family,
     _build_families_list,
-    _ensure_family_exists,
-    _add_child_if_valid,
     _find_person_by_id,
+    _build_person_index,
     _create_child_data,
     _create_family_data,
 )
@@ -89,6 +88,28 @@ class TestConvertToJsonSerializable:
         assert convert_to_json_serializable(True) == True
         assert convert_to_json_serializable(None) == None
 
+    def test_convert_subclasses(self):
+        """Test conversion of subclasses of the supported types."""
+        from collections import OrderedDict
+
+        class Birthday(date):
+            pass
+
+        class Timestamp(datetime):
+            pass
+
+        obj = OrderedDict(
+            birthday=Birthday(2023, 1, 1),
+            created=Timestamp(2023, 1, 1, 12, 30, 45),
+            items=(1, 2),
+        )
+        result = convert_to_json_serializable(obj)
+        assert result == {
+            "birthday": "2023-01-01",
+            "created": "2023-01-01T12:30:45",
+            "items": (1, 2),
+        }
+
 
 class TestBuildPersonLookup:
     """Test the _build_person_lookup function."""
@@ -144,6 +165,14 @@ class TestBuildPersonLookup:
         expected = {"person1": "John", "person2": "Smith", "person3": ""}
         assert result == expected
 
+    def test_build_person_lookup_null_names(self):
+        """Test building person lookup with null names."""
+        db_json = {
+            "persons": [{"id": "person1", "first_name": None, "last_name": "Doe"}]
+        }
+        result = _build_person_lookup(db_json)
+        assert result == {"person1": "Doe"}
+
 
 class TestBuildChildrenByFamily:
     """Test the _build_children_by_family function."""
@@ -259,19 +288,6 @@ class TestBuildFamiliesList:
 class TestHelperFunctions:
     """Test helper functions."""
 
-    def test_ensure_family_exists(self):
-        """Test _ensure_family_exists function."""
-        children_by_family = {}
-        _ensure_family_exists(children_by_family, "family1")
-        assert "family1" in children_by_family
-        assert children_by_family["family1"] == []
-
-    def test_ensure_family_exists_already_exists(self):
-        """Test _ensure_family_exists with existing family."""
-        children_by_family = {"family1": ["existing"]}
-        _ensure_family_exists(children_by_family, "family1")
-        assert children_by_family["family1"] == ["existing"]
-
     def test_find_person_by_id(self):
         """Test _find_person_by_id function."""
         db_json = {
@@ -280,15 +296,23 @@ class TestHelperFunctions:
                 {"id": "person2", "name": "Jane"},
             ]
         }
-        result = _find_person_by_id(db_json, "person1")
+        result = _find_person_by_id(_build_person_index(db_json), "person1")
         assert result == {"id": "person1", "name": "John"}
 
     def test_find_person_by_id_not_found(self):
         """Test _find_person_by_id with non-existent person."""
         db_json = {"persons": []}
-        result = _find_person_by_id(db_json, "person1")
+        result = _find_person_by_id(_build_person_index(db_json), "person1")
         assert result is None
 
+    def test_build_person_index(self):
+        """Test _build_person_index keys persons by string ID."""
+        test_uuid = uuid4()
+        first = {"id": test_uuid, "name": "John"}
+        db_json = {"persons": [first, {"id": test_uuid, "name": "Duplicate"}]}
+        result = _build_person_index(db_json)
+        assert result == {str(test_uuid): first}
+
     def test_create_child_data(self):
         """Test _create_child_data function."""
         child_person = {"sex": "F"}
@@ -4,18 +4,29 @@ import pytest
 from gw_parser import GWParser
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def gw_file_path():
     return Path(__file__).parent / "galichet.gw"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def parser(gw_file_path):
     return GWParser(gw_file_path)
 
 
-def test_parser_runs(parser):
-    result = parser.parse()
+@pytest.fixture(scope="module")
+def result(parser):
+    return parser.parse()
+
+
+@pytest.fixture(scope="module")
+def json_output(tmp_path_factory, parser, result):
+    out_file = tmp_path_factory.mktemp("gw") / "out.json"
+    parser.to_json(out_file)
+    return out_file
+
+
+def test_parser_runs(result):
     assert isinstance(result, dict)
     assert "families" in result
     assert "people" in result
@@ -24,14 +35,12 @@ def test_parser_runs(parser):
     assert "raw_header" in result
 
 
-def test_header_parsing(parser):
-    result = parser.parse()
+def test_header_parsing(result):
     assert result["raw_header"]["encoding"].lower() == "utf-8"
     assert result["raw_header"]["gwplus"] is True
 
 
-def test_family_parsing(parser):
-    result = parser.parse()
+def test_family_parsing(result):
     assert len(result["families"]) > 0
 
     for fam in result["families"]:
@@ -40,8 +49,7 @@ def test_family_parsing(parser):
         assert "children" in fam
 
 
-def test_events_parsing(parser):
-    result = parser.parse()
+def test_events_parsing(result):
     found_event = False
 
     for fam in result["families"]:
@@ -53,17 +61,14 @@ def test_events_parsing(parser):
     assert found_event, "No events found — check test data."
 
 
-def test_children_parsing(parser):
-    result = parser.parse()
-
+def test_children_parsing(result):
     for fam in result["families"]:
         for child in fam["children"]:
             assert "gender" in child or "raw_line" in child
             assert "person" in child or "raw_line" in child
 
 
-def test_notes_parsing(parser):
-    result = parser.parse()
+def test_notes_parsing(result):
     assert len(result["notes"]) > 0
     for note in result["notes"]:
         assert "person" in note
@@ -71,8 +76,7 @@ def test_notes_parsing(parser):
         assert isinstance(note["text"], str)
 
 
-def test_person_events_parsing(parser):
-    result = parser.parse()
+def test_person_events_parsing(result):
     assert len(result["people"]) > 0
     for pevt in result["people"]:
         assert "person" in pevt
@@ -81,28 +85,22 @@ def test_person_events_parsing(parser):
             assert "type" in evt
 
 
-def test_notes_db_parsing(parser):
-    result = parser.parse()
+def test_notes_db_parsing(result):
     assert result["database_notes"] is not None
     assert "text" in result["database_notes"]
     assert "Ceci est une base de test." in result["database_notes"]["text"]
 
 
-def test_extended_pages_parsing(parser):
-    result = parser.parse()
+def test_extended_pages_parsing(result):
     assert len(result["extended_pages"]) > 0
     for page in result["extended_pages"]:
         assert "name" in page
         assert "title" in page or page["title"] is None
 
 
-def test_to_json(tmp_path, parser):
-    parser.parse()
-    out_file = tmp_path / "out.json"
-    parser.to_json(out_file)
-
-    assert out_file.exists()
-    loaded = json.loads(out_file.read_text(encoding="utf-8"))
+def test_to_json(json_output):
+    assert json_output.exists()
+    loaded = json.loads(json_output.read_text(encoding="utf-8"))
     assert "families" in loaded
     assert "people" in loaded
     assert "notes" in loaded
@@ -71,3 +71,14 @@ class TestParseDateToken:
         """Test parsing string with no date pattern."""
         result = parse_date_token("invalid")
         assert result == {"raw": "invalid"}
+
+    def test_result_is_a_copy(self):
+        """Test that mutating a result does not affect later parses."""
+        result = parse_date_token("1800..1850")
+        result["between"].append("1900")
+        result["value"] = "changed"
+
+        assert parse_date_token(" 1800..1850 ") == {
+            "raw": "1800..1850",
+            "between": ["1800", "1850"],
+        }
@@ -21,6 +21,12 @@ class TestSplitFamilyHeader:
         assert husband == "Jean"
         assert wife == "Marie"
 
+    def test_spaced_plus_takes_priority(self):
+        """Test a spaced plus wins over a bare plus earlier in the header."""
+        husband, wife = split_family_header("Dupont Jean+1 + Martin Marie")
+        assert husband == "Dupont Jean+1"
+        assert wife == "Martin Marie"
+
     def test_no_separator(self):
         """Test splitting with no separator."""
         husband, wife = split_family_header("Jean Baptiste")
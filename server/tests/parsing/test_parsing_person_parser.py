@@ -56,3 +56,9 @@ class TestParsePersonSegment:
         assert "src" in result["tags"]
         assert result["tags"]["occu"] == ["Engineer"]
         assert result["tags"]["src"] == ["Registry"]
+
+    def test_tag_names_are_shared(self):
+        """Test tag names are the same string object across persons."""
+        first = parse_person_segment("Jean Baptiste #occu Engineer")
+        second = parse_person_segment("Marie Dubois #occu Teacher")
+        assert next(iter(first["tags"])) is next(iter(second["tags"]))
@@ -41,6 +41,11 @@ class TestTokenizePreservingBraces:
         result = tokenize_preserving_braces("{Jean Baptiste Laurent}")
         assert result == ["{Jean Baptiste Laurent}"]
 
+    def test_unclosed_brace_runs_to_end(self):
+        """Test an unclosed brace keeps the rest of the text together."""
+        result = tokenize_preserving_braces("Jean {Jean Baptiste")
+        assert result == ["Jean", "{Jean Baptiste"]
+
 
 class TestExtractTagsAndDatesFromTokens:
     """Test extract_tags_and_dates_from_tokens function."""
@@ -86,6 +91,17 @@ class TestExtractNameTokens:
         assert name_tokens == ["Jean", "Baptiste"]
         assert remaining == ["1814", "Paris"]
 
+    @pytest.mark.parametrize(
+        "date_token",
+        ["<1814", "~1814", "?1814", "/1814/", ".1814", "|1814"],
+        ids=["before", "about", "maybe", "slashes", "dot", "or"],
+    )
+    def test_stops_on_qualified_date_token(self, date_token):
+        """Test stopping on date tokens starting with a qualifier."""
+        name_tokens, remaining = extract_name_tokens(["Jean", date_token])
+        assert name_tokens == ["Jean"]
+        assert remaining == [date_token]
+
     def test_all_name_tokens(self):
         """Test all tokens are name tokens."""
         tokens = ["Jean", "Baptiste", "Laurent"]
@@ -109,6 +125,18 @@ class TestSplitNameIntoParts:
         assert first == "Jean"
         assert last == ""
 
+    def test_surrounding_whitespace(self):
+        """Test surrounding whitespace is not kept in either part."""
+        first, last = split_name_into_parts("  Jean Baptiste Laurent \n")
+        assert first == "Jean"
+        assert last == "Baptiste Laurent"
+
+    def test_braced_multi_space_name(self):
+        """Test whitespace inside a braced last name is collapsed."""
+        first, last = split_name_into_parts("Jean {Van  der}\tBerg")
+        assert first == "Jean"
+        assert last == "{Van der} Berg"
+
     def test_empty_name(self):
         """Test empty name."""
         first, last = split_name_into_parts("")
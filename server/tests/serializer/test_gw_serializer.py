@@ -66,6 +66,22 @@ def test_to_file(tmp_path, populated_data):
     assert file_path.exists()
     content = file_path.read_text(encoding="utf-8")
     assert "fam Test" in content
+    assert content == serializer.serialize()
+
+
+def test_to_file_failure_keeps_existing_file(tmp_path, populated_data, monkeypatch):
+    file_path = tmp_path / "output.gw"
+    file_path.write_text("existing content", encoding="utf-8")
+
+    def failing_section(_self):
+        raise ValueError("boom")
+
+    monkeypatch.setattr(GWSerializer, "_serialize_notes", failing_section)
+    with pytest.raises(ValueError):
+        GWSerializer(populated_data).to_file(str(file_path))
+
+    assert file_path.read_text(encoding="utf-8") == "existing content"
+    assert [p.name for p in tmp_path.iterdir()] == ["output.gw"]
 
 
 def test_missing_sections(minimal_data):
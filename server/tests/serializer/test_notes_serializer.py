@@ -16,9 +16,7 @@ def test_serialize_notes_db_multiple_keys():
     result = serialize_notes_db(notes_db)
     lines = result.splitlines()
 
-    assert lines[0] == "notes-db"
-    assert "  text=Test" in lines
-    assert "  author=John Doe" in lines
+    assert lines == ["notes-db", "  text=Test", "  author=John Doe"]
 
 
 def test_serialize_notes_db_empty():
@@ -1,5 +1,10 @@
 import pytest
-from serializer.person_serializer import serialize_person, serialize_person_events
+from serializer import person_serializer
+from serializer.person_serializer import (
+    serialize_person,
+    serialize_person_events,
+    _serialize_person_events_lines,
+)
 
 
 # ==========================================================
@@ -15,10 +20,11 @@ def test_serialize_person_basic():
 
 def test_serialize_person_with_tags_and_dates(monkeypatch):
     monkeypatch.setattr(
-        "serializer.person_serializer.serialize_tags", lambda x: ["#tag1 a", "#tag2 b"]
+        person_serializer, "serialize_tags", lambda x: ["#tag1 a", "#tag2 b"]
     )
     monkeypatch.setattr(
-        "serializer.person_serializer.serialize_dates",
+        person_serializer,
+        "serialize_dates",
         lambda x: ["2025-01-01", "2025-01-02"],
     )
 
@@ -42,16 +48,16 @@ def test_serialize_person_raw_mode():
 
 
 def test_serialize_person_handles_missing_fields(monkeypatch):
-    monkeypatch.setattr("serializer.person_serializer.serialize_tags", lambda x: [])
-    monkeypatch.setattr("serializer.person_serializer.serialize_dates", lambda x: [])
+    monkeypatch.setattr(person_serializer, "serialize_tags", lambda x: [])
+    monkeypatch.setattr(person_serializer, "serialize_dates", lambda x: [])
     result = serialize_person({})
     assert isinstance(result, str)
     assert result == ""
 
 
 def test_serialize_person_with_empty_tags_and_dates(monkeypatch):
-    monkeypatch.setattr("serializer.person_serializer.serialize_tags", lambda x: [])
-    monkeypatch.setattr("serializer.person_serializer.serialize_dates", lambda x: [])
+    monkeypatch.setattr(person_serializer, "serialize_tags", lambda x: [])
+    monkeypatch.setattr(person_serializer, "serialize_dates", lambda x: [])
     person = {"name": "Eve", "tags": {}, "dates": []}
     result = serialize_person(person)
     assert result.strip() == "Eve"
@@ -64,16 +70,13 @@ def test_serialize_person_with_empty_tags_and_dates(monkeypatch):
 
 def test_serialize_person_events_basic(monkeypatch):
     monkeypatch.setattr(
-        "serializer.person_serializer.serialize_event", lambda e: f"event {e['type']}"
+        person_serializer, "serialize_event", lambda e: f"event {e['type']}"
     )
     person = {"name": "Bob", "events": [{"type": "birth"}, {"type": "death"}]}
-    result = serialize_person_events(person)
-    lines = result.splitlines()
+    lines = _serialize_person_events_lines(person)
 
-    assert lines[0] == "pevt Bob"
-    assert "event birth" in result
-    assert "event death" in result
-    assert lines[-1] == "end pevt"
+    assert lines == ["pevt Bob", "event birth", "event death", "end pevt"]
+    assert serialize_person_events(person) == "\n".join(lines)
 
 
 def test_serialize_person_events_empty_events():
@@ -89,18 +92,14 @@ def test_serialize_person_events_no_events_key():
 
 
 def test_serialize_person_events_with_invalid_event(monkeypatch):
-    monkeypatch.setattr(
-        "serializer.person_serializer.serialize_event", lambda e: "event_invalid"
-    )
+    monkeypatch.setattr(person_serializer, "serialize_event", lambda e: "event_invalid")
     person = {"name": "Carl", "events": [None, {}]}
-    result = serialize_person_events(person)
-    assert result.count("event_invalid") == 2
+    lines = _serialize_person_events_lines(person)
+    assert lines == ["pevt Carl", "event_invalid", "event_invalid", "end pevt"]
 
 
 def test_serialize_person_events_handles_strange_names(monkeypatch):
-    monkeypatch.setattr(
-        "serializer.person_serializer.serialize_event", lambda e: "event test"
-    )
+    monkeypatch.setattr(person_serializer, "serialize_event", lambda e: "event test")
     person = {"name": "Jöhn Dœ #42", "events": [{"type": "birth"}]}
     result = serialize_person_events(person)
     assert "pevt Jöhn Dœ #42" in result
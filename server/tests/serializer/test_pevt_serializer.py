@@ -2,13 +2,15 @@ from pathlib import Path
 import pytest
 import sys
 
+from serializer import pevt_serializer
 from serializer.pevt_serializer import serialize_pevts
 
 
 @pytest.fixture
 def mock_serialize_event(monkeypatch):
     monkeypatch.setattr(
-        "serializer.pevt_serializer.serialize_event",
+        pevt_serializer,
+        "serialize_event",
         lambda e: f"EVENT:{e.get('type', 'unknown')}",
     )
     return None
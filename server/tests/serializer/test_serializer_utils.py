@@ -60,25 +60,22 @@ def test_serialize_dates_non_string_values():
 
 
 @pytest.mark.parametrize(
-    "gender,input_value,expected",
+    "input_value,expected",
     [
-        ("male", "male", "h"),
-        ("male", "m", "h"),
-        ("male", "man", "h"),
-        ("male", "homme", "h"),
-        ("male", "h", "h"),
-        ("female", "female", "f"),
-        ("female", "f", "f"),
-        ("female", "woman", "f"),
-        ("female", "femme", "f"),
-        ("male", "unknown", "h"),
-        ("male", "", "h"),
-        ("male", None, "h"),
+        ("male", "h"),
+        ("m", "h"),
+        ("man", "h"),
+        ("homme", "h"),
+        ("h", "h"),
+        ("female", "f"),
+        ("f", "f"),
+        ("woman", "f"),
+        ("femme", "f"),
+        ("unknown", "h"),
     ],
 )
-def test_gender_prefix(gender, input_value, expected):
-    result = gender_prefix(input_value if input_value is not None else "")
-    assert result == expected
+def test_gender_prefix(input_value, expected):
+    assert gender_prefix(input_value) == expected
 
 
 def test_gender_prefix_case_insensitive():
@@ -2,7 +2,8 @@ import pytest
 from uuid import uuid4
 
 from src.crud.child import child_crud
-from src.models.child import ChildCreate
+from src.models.child import Child, ChildCreate
+from src.models.person import Person, Sex
 
 
 class TestChildCRUD:
@@ -159,17 +160,15 @@ class TestChildCRUD:
         self, test_db, sample_family, sample_person, sample_person_2
     ):
         """Test getting all child relationships with pagination."""
-        for i in range(5):
-            from src.crud.person import person_crud
-            from src.models.person import PersonCreate, Sex
-
-            person_data = PersonCreate(
-                first_name=f"Child{i}", last_name="Test", sex=Sex.MALE
-            )
-            person = person_crud.create(test_db, person_data)
-
-            child_data = ChildCreate(family_id=sample_family.id, child_id=person.id)
-            child_crud.create(test_db, child_data)
+        persons = [
+            Person(first_name=f"Child{i}", last_name="Test", sex=Sex.MALE)
+            for i in range(5)
+        ]
+        test_db.add_all(persons)
+        test_db.add_all(
+            Child(family_id=sample_family.id, child_id=person.id) for person in persons
+        )
+        test_db.flush()
 
         children = child_crud.get_all(test_db, skip=0, limit=3)
 
@@ -220,6 +220,28 @@ class TestFamilyCRUD:
         assert family1.id in family_ids
         assert family2.id in family_ids
 
+    def test_get_by_spouses(
+        self, test_db, sample_family, sample_person, sample_person_2
+    ):
+        """Test getting families for several spouses in one call."""
+        non_existent_id = uuid4()
+
+        families_by_spouse = family_crud.get_by_spouses(
+            test_db, [sample_person.id, sample_person_2.id, non_existent_id]
+        )
+
+        assert [f.id for f in families_by_spouse[sample_person.id]] == [
+            sample_family.id
+        ]
+        assert [f.id for f in families_by_spouse[sample_person_2.id]] == [
+            sample_family.id
+        ]
+        assert non_existent_id not in families_by_spouse
+
+    def test_get_by_spouses_empty(self, test_db):
+        """Test getting families for an empty list of spouses."""
+        assert family_crud.get_by_spouses(test_db, []) == {}
+
     def test_update_family_full_update(
         self, test_db, sample_family, sample_person, sample_person_2
     ):
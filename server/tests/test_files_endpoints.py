@@ -0,0 +1,44 @@
+from src.converter.json_normalizer import convert_to_json_serializable
+
+
+class TestExportJson:
+    """Test the JSON export endpoint."""
+
+    def test_export_json(
+        self, client, sample_family, sample_child, sample_event, sample_person
+    ):
+        """Test exporting the database as JSON-serializable data."""
+        response = client.get("/api/v1/files/export/json")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert sorted(data["persons"], key=lambda p: p["id"]) == sorted(
+            (
+                convert_to_json_serializable(p.model_dump())
+                for p in [sample_person, sample_family.wife]
+            ),
+            key=lambda p: p["id"],
+        )
+        assert data["families"] == [
+            convert_to_json_serializable(sample_family.model_dump())
+        ]
+        assert data["events"] == [
+            convert_to_json_serializable(sample_event.model_dump())
+        ]
+        assert data["children"] == [
+            convert_to_json_serializable(sample_child.model_dump())
+        ]
+        assert data["events"][0]["date"] == "1990-01-01"
+        assert data["events"][0]["person_id"] == str(sample_person.id)
+
+    def test_export_json_empty(self, client):
+        """Test exporting an empty database."""
+        response = client.get("/api/v1/files/export/json")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "persons": [],
+            "families": [],
+            "events": [],
+            "children": [],
+        }
@@ -4,7 +4,7 @@ Tests for geneweb_converter module.
 
 import pytest
 from unittest.mock import Mock, patch
-from src.geneweb_converter import json_to_db, db_to_json
+from src.geneweb_converter import json_to_db, db_to_json, _serialize_persons
 
 
 class TestJsonToDb:
@@ -431,3 +431,28 @@ class TestDbToJson:
             mock_event1.model_dump.assert_called_once()
             mock_event2.model_dump.assert_called_once()
             mock_child.model_dump.assert_called_once()
+
+
+class TestSerializePersons:
+    """Test the _serialize_persons helper."""
+
+    def test_serialize_persons_groups_events_by_person(self):
+        """Test that each person only receives their own events."""
+        person1 = Mock(id="person1")
+        person2 = Mock(id="person2")
+        person3 = Mock(id="person3")
+
+        birth = Mock(id="event1", person_id="person1", family_id=None)
+        death = Mock(id="event2", person_id="person1", family_id=None)
+        baptism = Mock(id="event3", person_id="person2", family_id=None)
+        marriage = Mock(id="event4", person_id=None, family_id="family1")
+
+        result = _serialize_persons(
+            [person1, person2, person3], [birth, death, baptism, marriage]
+        )
+
+        assert [e["id"] for e in result[0]["events"]] == ["event1", "event2"]
+        assert [e["id"] for e in result[1]["events"]] == ["event3"]
+        assert result[2]["events"] == []
+        assert result[1]["events"][0]["person_id"] == "person2"
+        assert result[1]["events"][0]["family_id"] is None
@@ -0,0 +1,243 @@
+"""
+Tests for validators module.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from src.validators import (
+    validate_event_dates,
+    validate_event_relationships,
+    validate_family_dates,
+    validate_family_spouses,
+    validate_person_dates,
+    validate_person_names,
+)
+
+TOMORROW = date.today() + timedelta(days=1)
+
+
+class TestValidatePersonDates:
+    """Test the validate_person_dates function."""
+
+    def test_valid_dates(self):
+        """Test that consistent dates are accepted."""
+        validate_person_dates(date(1900, 1, 1), date(1980, 1, 1))
+        validate_person_dates(None, None)
+
+    @pytest.mark.parametrize(
+        "birth_date,death_date,detail",
+        [
+            (TOMORROW, None, "Birth date cannot be in the future"),
+            (None, TOMORROW, "Death date cannot be in the future"),
+            (
+                date(1980, 1, 1),
+                date(1900, 1, 1),
+                "Death date cannot be before birth date",
+            ),
+        ],
+    )
+    def test_invalid_dates(self, birth_date, death_date, detail):
+        """Test that inconsistent dates are rejected."""
+        with pytest.raises(HTTPException) as exc_info:
+            validate_person_dates(birth_date, death_date)
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == detail
+
+
+class TestValidateFamilyDates:
+    """Test the validate_family_dates function."""
+
+    def test_valid_dates(self):
+        """Test that consistent dates are accepted."""
+        validate_family_dates(
+            marriage_date=date(1950, 6, 1),
+            divorce_date=date(1960, 1, 1),
+            husband_birth_date=date(1920, 1, 1),
+            wife_birth_date=date(1925, 1, 1),
+            husband_death_date=date(1990, 1, 1),
+            wife_death_date=date(1995, 1, 1),
+        )
+        validate_family_dates()
+
+    def test_no_marriage_date_skips_relative_checks(self):
+        """Test that spouse dates are not compared without a marriage date."""
+        validate_family_dates(
+            husband_birth_date=date(1990, 1, 1),
+            wife_death_date=date(1900, 1, 1),
+        )
+
+    @pytest.mark.parametrize(
+        "overrides,detail",
+        [
+            (
+                {"marriage_date": TOMORROW},
+                "Marriage date cannot be in the future",
+            ),
+            (
+                {"divorce_date": TOMORROW},
+                "Divorce date cannot be in the future",
+            ),
+            (
+                {"marriage_date": date(1950, 1, 1), "divorce_date": date(1949, 1, 1)},
+                "Divorce date cannot be before marriage date",
+            ),
+            (
+                {
+                    "marriage_date": date(1950, 1, 1),
+                    "husband_birth_date": date(1960, 1, 1),
+                },
+                "Marriage date cannot be before husband's birth date",
+            ),
+            (
+                {
+                    "marriage_date": date(1950, 1, 1),
+                    "wife_birth_date": date(1960, 1, 1),
+                },
+                "Marriage date cannot be before wife's birth date",
+            ),
+            (
+                {
+                    "marriage_date": date(1950, 1, 1),
+                    "husband_death_date": date(1940, 1, 1),
+                },
+                "Marriage date cannot be after husband's death date",
+            ),
+            (
+                {
+                    "marriage_date": date(1950, 1, 1),
+                    "wife_death_date": date(1940, 1, 1),
+                },
+                "Marriage date cannot be after wife's death date",
+            ),
+        ],
+    )
+    def test_invalid_dates(self, overrides, detail):
+        """Test that inconsistent dates are rejected."""
+        with pytest.raises(HTTPException) as exc_info:
+            validate_family_dates(**overrides)
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == detail
+
+
+class TestValidateEventDates:
+    """Test the validate_event_dates function."""
+
+    def test_valid_dates(self):
+        """Test that an event within the person's lifetime is accepted."""
+        validate_event_dates(date(1950, 1, 1), date(1900, 1, 1), date(1990, 1, 1))
+        validate_event_dates()
+
+    @pytest.mark.parametrize(
+        "event_date,birth_date,death_date,detail",
+        [
+            (TOMORROW, None, None, "Event date cannot be in the future"),
+            (
+                date(1890, 1, 1),
+                date(1900, 1, 1),
+                None,
+                "Event date cannot be before person's birth date",
+            ),
+            (
+                date(1995, 1, 1),
+                None,
+                date(1990, 1, 1),
+                "Event date cannot be after person's death date",
+            ),
+        ],
+    )
+    def test_invalid_dates(self, event_date, birth_date, death_date, detail):
+        """Test that inconsistent dates are rejected."""
+        with pytest.raises(HTTPException) as exc_info:
+            validate_event_dates(event_date, birth_date, death_date)
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == detail
+
+
+class TestValidatePersonNames:
+    """Test the validate_person_names function."""
+
+    def test_valid_names(self):
+        """Test that non-blank and missing names are accepted."""
+        validate_person_names("John", " Doe ")
+        validate_person_names(None, None)
+
+    @pytest.mark.parametrize(
+        "first_name,last_name,detail",
+        [
+            ("", "Doe", "First name cannot be empty"),
+            ("  ", "Doe", "First name cannot be empty"),
+            ("John", "", "Last name cannot be empty"),
+            ("John", "\t", "Last name cannot be empty"),
+        ],
+    )
+    def test_blank_names(self, first_name, last_name, detail):
+        """Test that blank names are rejected."""
+        with pytest.raises(HTTPException) as exc_info:
+            validate_person_names(first_name, last_name)
+
+        assert exc_info.value.status_code == 422
+        assert exc_info.value.detail == detail
+
+
+class TestValidateFamilySpouses:
+    """Test the validate_family_spouses function."""
+
+    @pytest.mark.parametrize(
+        "husband_id,wife_id", [("h1", "w1"), ("h1", None), (None, "w1")]
+    )
+    def test_valid_spouses(self, husband_id, wife_id):
+        """Test that one or two distinct spouses are accepted."""
+        validate_family_spouses(husband_id, wife_id)
+
+    def test_no_spouse(self):
+        """Test that a family without spouses is rejected."""
+        with pytest.raises(HTTPException) as exc_info:
+            validate_family_spouses(None, None)
+
+        assert exc_info.value.status_code == 422
+
+    def test_same_spouse(self):
+        """Test that the same person cannot be both spouses."""
+        with pytest.raises(HTTPException) as exc_info:
+            validate_family_spouses("p1", "p1")
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == "Same person cannot be both husband and wife"
+
+
+class TestValidateEventRelationships:
+    """Test the validate_event_relationships function."""
+
+    @pytest.mark.parametrize("person_id,family_id", [("p1", None), (None, "f1")])
+    def test_valid_relationships(self, person_id, family_id):
+        """Test that an event linked to exactly one owner is accepted."""
+        validate_event_relationships(person_id, family_id)
+
+    @pytest.mark.parametrize(
+        "person_id,family_id,detail",
+        [
+            (
+                "p1",
+                "f1",
+                "Event cannot be associated with both a person and a family",
+            ),
+            (
+                None,
+                None,
+                "Event must be associated with either a person or a family",
+            ),
+        ],
+    )
+    def test_invalid_relationships(self, person_id, family_id, detail):
+        """Test that an event must have exactly one owner."""
+        with pytest.raises(HTTPException) as exc_info:
+            validate_event_relationships(person_id, family_id)
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == detail